@@ -6,6 +6,12 @@ Regenerate the **clean inputs** that power MCP-MOOSE:
 2. **syntax_map.json** - mapping ``name → mini-syntax snippet`` used by
    the prompt helper.  Every entry in *objects.json* has a corresponding
    key in *syntax_map.json* and vice-versa.
+3. **syntax_map.bin** + **syntax_map.idx** - the same mapping laid out for
+   *syntax_srv*: all snippets as raw UTF-8 back to back, plus a pickled
+   ``name → (offset, length)`` index.  The service mmaps the blob and only
+   decodes the snippets it serves.  Always written after *syntax_map.json*
+   (and re-touched if they ever fall behind it); the service ignores them
+   once they are older than the JSON.
 
 Usage
 -----
@@ -15,58 +21,87 @@ python scripts/make_objects.py            # default paths in ./artifacts
 python scripts/make_objects.py --src ~/dump.json --dst ./artifacts
 ```
 
-The script **only touches the two output files if the new content is
+The script **only touches the output files if the new content is
 actually different**, so you can drop it into CI without creating noisy
-git diffs.
+git diffs.  A digest of each payload (plus the size and mtime of the file
+written for it) is kept in a hidden ``.<file>.sha`` sidecar, so unchanged,
+untouched outputs are not even re-serialised; changed or damaged ones are
+replaced atomically.
 """
 
 import argparse
-import json
+import functools
+import hashlib
+import os
 import pathlib
+import pickle
 import sys
+import tempfile
+from collections.abc import Callable
+
+import ijson
+import orjson
+
+from moose_mcp.packing import LAYOUT_VERSION, pack_syntax_map
 
 # -----------------------------------------------------------------------------
 # Helpers
 # -----------------------------------------------------------------------------
 _EXCLUDE = {"star", "actions", "subblock_types"}
+_NOISE = frozenset({"type", "active", "inactive"})  # parameters left out of snippets
+_DUMP_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
 
 
-def _format_snippet(path: list[str], node: dict) -> str:
-    """Return a prompt-friendly snippet for a single Moose object."""
-    category, obj_name = path[:2]
-    lines = [f"[{category}]", f"  type = {obj_name}"]
-
-    for pname in node.get("parameters", {}).keys():
-        if pname in {"type", "active", "inactive"}:  # noise parameters
-            continue
-        lines.append(f"  {pname} = ")
-
-    lines.append("[../]")
-    return "\n".join(lines)
+def _dumps(obj: object) -> bytes:
+    """Serialise *obj* as indented, key-sorted JSON (stable across runs)."""
+    return orjson.dumps(obj, option=_DUMP_OPTS)
 
 
 def _walk(
     node: dict, chain: list[str], objects: set[str], syntax_map: dict[str, str]
 ) -> None:
-    """Recursive DFS that populates *objects* and *syntax_map*."""
+    """Iterative pre-order DFS that populates *objects* and *syntax_map*."""
     if not isinstance(node, dict):
         return
 
-    for key, sub in node.items():
-        # Skip template layers but keep the current chain
-        if key in _EXCLUDE:
-            _walk(sub, chain, objects, syntax_map)
-            continue
-
-        next_chain = chain + [key]
-
-        # Real Moose object: a dict with a 'parameters' entry
-        if isinstance(sub, dict) and "parameters" in sub:
-            obj_name = "/".join(next_chain[:2])
-            objects.add(obj_name)
-            syntax_map[obj_name] = _format_snippet(next_chain[:2], sub)
+    # One shared chain, truncated back to each entry's depth on pop, instead
+    # of a fresh list per node.  Children are pushed in reverse so they pop
+    # in document order - later snippets for the same name must still
+    # overwrite earlier ones.
+    chain = list(chain)
+    depth = len(chain)
+    stack = [(key, sub, depth) for key, sub in reversed(node.items())]
+    while stack:
+        key, sub, depth = stack.pop()
+        del chain[depth:]
+
+        # JSON decoders only produce plain dicts, so the exact type check is
+        # safe and cheaper than isinstance on this hot path.
+        is_dict = type(sub) is dict  # pylint: disable=unidiomatic-typecheck
 
-        _walk(sub, next_chain, objects, syntax_map)
+        # Skip template layers but keep the current chain
+        if key not in _EXCLUDE:
+            chain.append(key)
+
+            # Real Moose object: a dict with a 'parameters' entry
+            params = sub.get("parameters") if is_dict else None
+            if params is not None:
+                category, obj_name = chain[:2]
+                name = sys.intern(f"{category}/{obj_name}")
+                objects.add(name)
+                # prompt-friendly snippet for a single Moose object
+                syntax_map[name] = "\n".join(
+                    [
+                        f"[{category}]",
+                        f"  type = {obj_name}",
+                        *[f"  {p} = " for p in params if p not in _NOISE],
+                        "[../]",
+                    ]
+                )
+
+        if is_dict:
+            depth = len(chain)
+            stack.extend((k, v, depth) for k, v in reversed(sub.items()))
 
 
 # -----------------------------------------------------------------------------
@@ -76,18 +111,20 @@ def _walk(
 
 def build(src: pathlib.Path) -> tuple[list[str], dict[str, str]]:
     """Return (object_list, syntax_map) from a raw Moose app JSON dump."""
+    objects: set[str] = set()
+    syntax_map: dict[str, str] = {}
+
+    # Stream the dump one top-level block at a time, so peak memory is
+    # bounded by the largest block rather than by the whole file.
     try:
-        data = json.loads(src.read_text(encoding="utf-8"))
+        with src.open("rb") as f:
+            for key, sub in ijson.kvitems(f, "blocks", use_float=True):
+                _walk({key: sub}, [], objects, syntax_map)
     except FileNotFoundError:
         sys.exit(f"❌ {src} not found - run 'app-name --json > {src}' first")
-    except json.JSONDecodeError as exc:
+    except ijson.JSONError as exc:
         sys.exit(f"❌ {src} is not valid JSON ({exc})")
 
-    objects: set[str] = set()
-    syntax_map: dict[str, str] = {}
-
-    _walk(data.get("blocks", {}), [], objects, syntax_map)
-
     if not objects or not syntax_map:
         sys.exit("❌ No objects discovered - JSON layout may have changed.")
 
@@ -95,18 +132,94 @@ def build(src: pathlib.Path) -> tuple[list[str], dict[str, str]]:
     return sorted(objects), syntax_map
 
 
-def write_if_changed(path: pathlib.Path, content: str) -> None:
-    """Write *content* to *path* only if it differs from the current file."""
-    if path.exists() and path.read_text(encoding="utf-8") == content:
-        return  # Unchanged - keep the mtime stable
-    path.write_text(content, encoding="utf-8")
-    print(f"✅ wrote {path.relative_to(path.parent.parent)}")
+def _digest(obj: object) -> str:
+    """Return a short digest of *obj* (compact JSON - cheap to produce)."""
+    return hashlib.blake2b(orjson.dumps(obj), digest_size=16).hexdigest()
+
+
+def _file_mode(path: pathlib.Path) -> int:
+    """Mode a plain ``write_bytes`` would leave *path* with."""
+    try:
+        return path.stat().st_mode & 0o7777  # keep an existing file's mode
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def _write_atomic(path: pathlib.Path, content: bytes) -> None:
+    """Write *content* to a temp file next to *path*, then swap it in."""
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f".{path.name}.", delete=False
+    ) as tmp:
+        try:
+            tmp.write(content)
+            tmp.close()
+            # NamedTemporaryFile creates files as 0600
+            os.chmod(tmp.name, _file_mode(path))
+            os.replace(tmp.name, path)
+        except BaseException:
+            os.unlink(tmp.name)
+            raise
+
+
+def _fingerprint(path: pathlib.Path) -> str:
+    """Cheap identity of the file currently at *path* (size + mtime)."""
+    st = path.stat()
+    return f"{st.st_size} {st.st_mtime_ns}"
+
+
+def write_if_changed(
+    path: pathlib.Path,
+    digest: str,
+    render: Callable[[], bytes],
+    source_mtime_ns: int | None = None,
+) -> int:
+    """Write ``render()`` to *path* only if the payload behind it changed.
+
+    The ``.sha`` sidecar records *digest* together with the fingerprint of
+    the file that was written for it.  When both still match, the payload is
+    not serialised at all; otherwise it is rendered and compared with the
+    file on disk, so a damaged or hand-edited output is always repaired.
+
+    *source_mtime_ns* is the value this function returned for the file that
+    *path* is derived from - i.e. a source already verified in this run.
+    *path* is then never left older than it, since *syntax_srv* uses exactly
+    that mtime check to trust the sidecars.
+
+    Returns the mtime (ns) of *path*, now verified to hold the payload.
+    """
+    sha = path.with_name(f".{path.name}.sha")
+    stale = (
+        source_mtime_ns is not None
+        and path.exists()
+        and path.stat().st_mtime_ns < source_mtime_ns
+    )
+    if (
+        path.exists()
+        and sha.exists()
+        and sha.read_text(encoding="utf-8") == f"{digest} {_fingerprint(path)}"
+    ):
+        if not stale:
+            return path.stat().st_mtime_ns  # Unchanged - keep the mtime stable
+        os.utime(path)  # same payload - only the mtime needs catching up
+        print(f"✅ touched {path.relative_to(path.parent.parent)}")
+    else:
+        content = render()
+        if not (path.exists() and path.read_bytes() == content):
+            _write_atomic(path, content)
+            print(f"✅ wrote {path.relative_to(path.parent.parent)}")
+        elif stale:
+            os.utime(path)
+            print(f"✅ touched {path.relative_to(path.parent.parent)}")
+    _write_atomic(sha, f"{digest} {_fingerprint(path)}".encode())
+    return path.stat().st_mtime_ns
 
 
 def main() -> None:
     """CLI entry-point - see module docstring for usage."""
     parser = argparse.ArgumentParser(
-        description="Regenerate objects & syntax_map JSON files"
+        description="Regenerate objects & syntax_map artifact files"
     )
     parser.add_argument(
         "--src",
@@ -127,8 +240,30 @@ def main() -> None:
 
     args.dst.mkdir(parents=True, exist_ok=True)
 
-    write_if_changed(args.dst / "objects.json", json.dumps(objects, indent=2))
-    write_if_changed(args.dst / "syntax_map.json", json.dumps(syntax_map, indent=2))
+    map_digest = _digest(syntax_map)
+    write_if_changed(
+        args.dst / "objects.json", _digest(objects), lambda: _dumps(objects)
+    )
+    map_mtime_ns = write_if_changed(
+        args.dst / "syntax_map.json", map_digest, lambda: _dumps(syntax_map)
+    )
+
+    # the sidecars must never be older than the (just verified) JSON, and
+    # must be rebuilt when either the map or their layout changes
+    layout_digest = _digest([LAYOUT_VERSION, map_digest])
+    packed = functools.cache(lambda: pack_syntax_map(syntax_map))
+    write_if_changed(
+        args.dst / "syntax_map.bin",
+        layout_digest,
+        lambda: packed()[0],
+        map_mtime_ns,
+    )
+    write_if_changed(
+        args.dst / "syntax_map.idx",
+        layout_digest,
+        lambda: pickle.dumps(packed()[1], protocol=5),
+        map_mtime_ns,
+    )
 
     print(f"🔢 total objects: {len(objects)}  |  syntax snippets: {len(syntax_map)}")
 
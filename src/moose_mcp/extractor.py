@@ -5,11 +5,18 @@ It returns a JSON list of the smallest set of MOOSE objects the LLM thinks
 are needed.  A quick *prefilter* reduces the enum (and model context window).
 """
 
+import asyncio
+import functools
 import json
 import os
 import sys
+from collections.abc import Iterable, Sequence
+
+import ahocorasick
 import openai
+import orjson
 from dotenv import load_dotenv
+from openai.types.chat import ChatCompletion
 
 load_dotenv()
 
@@ -20,16 +27,22 @@ OBJECT_FILE = os.getenv("MCP_OBJECT_LIST", "artifacts/objects.json")
 # ------------------------------------------------------------------ helpers
 
 
-def load_object_names(path: str) -> list[str]:
-    """Loads the object names."""
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+@functools.lru_cache(maxsize=4)
+def load_object_names(path: str) -> tuple[str, ...]:
+    """Loads the object names (cached per process - it is a build artifact)."""
+    with open(path, "rb") as f:
+        return tuple(orjson.loads(f.read()))
+
 
+def ensure(pfx: str, default: str, picked: list[str], present: set[str]) -> None:
+    """Ensures that some objects are included.
 
-def ensure(pfx: str, default: str, picked: list[str]) -> None:
-    "Ensures that some objects are included"
-    if not any(o.startswith(pfx) for o in picked):
+    *present* holds the ``Block/`` prefixes already in *picked*; it is kept
+    in sync so that consecutive calls can share it.
+    """
+    if pfx not in present:
         picked.append(default)
+        present.add(pfx)
 
 
 CORE_BLOCKS = (
@@ -42,26 +55,75 @@ CORE_BLOCKS = (
     "Outputs/",
     "Postprocessors/",
 )
+_CORE_PARENTS = frozenset(pfx.rstrip("/") for pfx in CORE_BLOCKS)
+
+
+@functools.lru_cache(maxsize=4)
+def _precompute(
+    all_objects: tuple[str, ...],
+) -> tuple[ahocorasick.Automaton | None, dict[str, list[int]], tuple[str, ...]]:
+    """
+    Everything *prefilter* needs that depends only on the object list:
+      • an Aho-Corasick automaton that finds all tokens in one prompt scan
+        (``None`` when there are no tokens at all);
+      • lower-cased parent/child token → positions of the objects it selects;
+      • the core objects that are always kept.
+    """
+    index: dict[str, list[int]] = {}
+    core: list[str] = []
+    for i, full in enumerate(all_objects):
+        parent, _, child = full.partition("/")
+        if parent in _CORE_PARENTS:
+            core.append(full)
+        for tok in dict.fromkeys((parent.lower(), child.lower())):
+            if tok:
+                index.setdefault(tok, []).append(i)
+
+    automaton = None
+    if index:
+        automaton = ahocorasick.Automaton()
+        for tok in index:
+            automaton.add_word(tok, tok)
+        automaton.make_automaton()
+
+    return automaton, index, tuple(core)
+
 
+def _is_word(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
 
-def prefilter(prompt: str, all_objects: list[str], min_keep: int = 200) -> list[str]:
+
+def _at_boundary(text: str, i: int) -> bool:
+    """True if a regex ``\\b`` would match just before ``text[i]``."""
+    before = i > 0 and _is_word(text[i - 1])
+    after = i < len(text) and _is_word(text[i])
+    return before != after
+
+
+def prefilter(
+    prompt: str, all_objects: Sequence[str], min_keep: int = 200
+) -> list[str]:
     """
     Return a trimmed list of object names likely relevant to the prompt.
     Heuristics:
-      • keep any name whose *parent block* appears in the prompt;
-      • keep any name whose own identifier appears verbatim;
+      • keep any name whose *parent block* appears in the prompt as a word;
+      • keep any name whose own identifier appears verbatim as a word;
       • always keep a small core set so the model has basics to choose from.
     """
+    automaton, index, core = _precompute(tuple(all_objects))
     prompt_lc = prompt.lower()
 
-    keep: list[str] = []
-    for full in all_objects:
-        parent, _, child = full.partition("/")
-        if parent.lower() in prompt_lc or child.lower() in prompt_lc:
-            keep.append(full)
+    # one pass over the prompt; only whole-word occurrences count
+    hits: set[int] = set()
+    if automaton is not None:
+        for end, tok in automaton.iter(prompt_lc):
+            start = end - len(tok) + 1
+            if _at_boundary(prompt_lc, start) and _at_boundary(prompt_lc, end + 1):
+                hits.update(index[tok])
+
+    keep = [all_objects[i] for i in sorted(hits)]
 
     # guarantee the core basics are present
-    core = [o for o in all_objects if o.startswith(CORE_BLOCKS)]
     keep.extend(core)
 
     # if we filtered too much, pad back up to `min_keep`
@@ -69,14 +131,18 @@ def prefilter(prompt: str, all_objects: list[str], min_keep: int = 200) -> list[
         keep.extend(all_objects[: min_keep - len(keep)])
 
     # deduplicate while preserving order
-    seen: set[str] = set()
-    result = [o for o in keep if not (o in seen or seen.add(o))]
-    return result
+    return list(dict.fromkeys(keep))
 
 
-def call_extractor(prompt: str, allowed: list[str]) -> list[str]:
+@functools.cache
+def _client() -> openai.OpenAI:
+    """Process-wide client, so warm calls reuse its connection pool."""
+    return openai.OpenAI()
+
+
+def _completion_kwargs(prompt: str, allowed: list[str]) -> dict:
     """
-    One function-call to an LLM with an enum list.
+    Request for one function-call to an LLM with an enum list.
     """
     schema = {
         "name": "pick_moose_objects",
@@ -96,10 +162,9 @@ def call_extractor(prompt: str, allowed: list[str]) -> list[str]:
         },
     }
 
-    client = openai.OpenAI()
-    response = client.chat.completions.create(
-        model=MODEL,
-        messages=[
+    return {
+        "model": MODEL,
+        "messages": [
             {
                 "role": "system",
                 "content": (
@@ -116,26 +181,93 @@ def call_extractor(prompt: str, allowed: list[str]) -> list[str]:
             },
             {"role": "user", "content": prompt},
         ],
-        functions=[schema],  # type: ignore[arg-type]
-        function_call={"name": "pick_moose_objects"},
-    )
+        "functions": [schema],
+        "function_call": {"name": "pick_moose_objects"},
+    }
 
-    args = json.loads(response.choices[0].message.function_call.arguments)  # type: ignore[arg-type]
+
+def _picked_from(response: ChatCompletion) -> list[str]:
+    """Pull the object list out of the function-call reply."""
+    args = json.loads(response.choices[0].message.function_call.arguments)  # type: ignore[union-attr]
     return args.get("objects", [])
 
 
+def call_extractor(prompt: str, allowed: list[str]) -> list[str]:
+    """
+    One function-call to an LLM with an enum list.
+    """
+    response = _client().chat.completions.create(**_completion_kwargs(prompt, allowed))
+    return _picked_from(response)
+
+
+async def call_extractor_async(
+    prompt: str, allowed: list[str], client: openai.AsyncOpenAI
+) -> list[str]:
+    """Async twin of *call_extractor* on a caller-owned client."""
+    response = await client.chat.completions.create(
+        **_completion_kwargs(prompt, allowed)
+    )
+    return _picked_from(response)
+
+
+def _postprocess(picked: list[str], allowed: list[str]) -> list[str]:
+    """Drop strays and make sure the mandatory blocks are there."""
+    allowed_set = set(allowed)
+    picked = [n for n in picked if n in allowed_set]  # drop strays
+
+    present = {o.split("/", 1)[0] + "/" for o in picked}
+    ensure("Mesh/", "Mesh/GeneratedMeshGenerator", picked, present)
+    ensure("Outputs/", "Outputs/CSV", picked, present)
+
+    return picked
+
+
 def extract_objects(prompt: str) -> list[str]:
     """Run the extractor pipeline and post-process the list a bit."""
-    all_objects = load_object_names(OBJECT_FILE)
-    allowed = prefilter(prompt, all_objects)
+    allowed = prefilter(prompt, load_object_names(OBJECT_FILE))
+    return _postprocess(call_extractor(prompt, allowed), allowed)
 
-    picked = call_extractor(prompt, allowed)
-    picked = [n for n in picked if n in allowed]  # drop strays
 
-    ensure("Mesh/", "Mesh/GeneratedMeshGenerator", picked)
-    ensure("Outputs/", "Outputs/CSV", picked)
+async def extract_objects_async(
+    prompt: str, client: openai.AsyncOpenAI | None = None
+) -> list[str]:
+    """Async twin of *extract_objects*; pass *client* to share one across calls."""
+    if client is None:
+        async with openai.AsyncOpenAI() as own_client:
+            return await extract_objects_async(prompt, own_client)
 
-    return picked
+    allowed = prefilter(prompt, load_object_names(OBJECT_FILE))
+    return _postprocess(await call_extractor_async(prompt, allowed, client), allowed)
+
+
+async def extract_many(
+    prompts: Iterable[str], max_concurrency: int = 8
+) -> list[list[str]]:
+    """
+    Run the pipeline for many prompts concurrently over one client.
+
+    At most *max_concurrency* requests are in flight at a time, to stay under
+    the API rate limits.  If any prompt fails, the others are cancelled (and
+    awaited) before the shared client is closed, then the error is re-raised.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    limit = asyncio.Semaphore(max_concurrency)
+
+    async with openai.AsyncOpenAI() as client:
+
+        async def run(prompt: str) -> list[str]:
+            async with limit:
+                return await extract_objects_async(prompt, client)
+
+        tasks = [asyncio.create_task(run(p)) for p in prompts]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
 
 # ------------------------------------------------------------------ entry-point
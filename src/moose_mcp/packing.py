@@ -0,0 +1,28 @@
+"""
+packing - on-disk layout of the syntax map sidecars.
+
+*make_objects.py* writes ``syntax_map.bin`` / ``syntax_map.idx`` with
+:func:`pack_syntax_map`, and *syntax_srv* uses the same function when it has
+to rebuild that layout in memory from ``syntax_map.json``.
+"""
+
+__all__ = ["LAYOUT_VERSION", "pack_syntax_map"]
+
+# Bump whenever the blob/index layout below changes, so that existing
+# sidecars are rebuilt even though the syntax map itself did not change.
+LAYOUT_VERSION = 1
+
+
+def pack_syntax_map(
+    syntax_map: dict[str, str],
+) -> tuple[bytes, dict[str, tuple[int, int]]]:
+    """Return (blob, index) - snippets as UTF-8 bytes and their byte spans."""
+    chunks: list[bytes] = []
+    index: dict[str, tuple[int, int]] = {}
+    offset = 0
+    for name, snippet in syntax_map.items():
+        raw = snippet.encode("utf-8")
+        chunks.append(raw)
+        index[name] = (offset, len(raw))
+        offset += len(raw)
+    return b"".join(chunks), index
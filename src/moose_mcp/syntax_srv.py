@@ -8,30 +8,59 @@ Environment variables
 
 Each key in the map is a ``Block/Object`` name and each value is the
 prompt-ready snippet (exactly what *make_objects.py* produced).
+
+If ``syntax_map.bin`` / ``syntax_map.idx`` sit next to the JSON and are not
+older than it, the JSON is not decoded at all: the blob is mmapped and only
+the requested snippets are sliced out and decoded.
 """
 
-import json
+import functools
+import mmap
 import os
 import pathlib
+import pickle
+
+import msgspec
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+from moose_mcp.packing import pack_syntax_map
 
 # ---------------------------------------------------------------------------
 # 1. Load the pre-built map once at start-up
 # ---------------------------------------------------------------------------
 MAP_PATH = pathlib.Path(os.getenv("SYNTAX_MAP", "artifacts/syntax_map.json"))
 
+
+def _load_map(
+    path: pathlib.Path,
+) -> tuple[bytes | mmap.mmap, dict[str, tuple[int, int]]]:
+    """Return (blob, index) - mmapped sidecars if fresh, else built from JSON."""
+    blob_path, idx_path = path.with_suffix(".bin"), path.with_suffix(".idx")
+    try:
+        json_mtime = path.stat().st_mtime
+        if min(blob_path.stat().st_mtime, idx_path.stat().st_mtime) >= json_mtime:
+            index = pickle.loads(idx_path.read_bytes())
+            with blob_path.open("rb") as f:
+                blob = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return blob, index
+    except (FileNotFoundError, EOFError, pickle.UnpicklingError, ValueError):
+        pass  # missing, stale or broken sidecars - fall back to the JSON
+
+    # same layout as the sidecars, so lookups work identically
+    return pack_syntax_map(orjson.loads(path.read_bytes()))
+
+
 try:
-    _SYNTAX_MAP: dict[str, str] = json.loads(MAP_PATH.read_text(encoding="utf-8"))
+    _BLOB, _INDEX = _load_map(MAP_PATH)
 except FileNotFoundError as exc:
     raise RuntimeError(
         f"Syntax map '{MAP_PATH}' not found. Have you run scripts/make_objects.py?"
     ) from exc
-except json.JSONDecodeError as exc:
+except orjson.JSONDecodeError as exc:
     raise RuntimeError(f"Syntax map '{MAP_PATH}' is not valid JSON.") from exc
 
-if not _SYNTAX_MAP:
+if not _INDEX:
     raise RuntimeError("Loaded syntax map is empty - something went wrong.")
 
 __all__ = ["get_syntax_text"]
@@ -41,6 +70,13 @@ __all__ = ["get_syntax_text"]
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=256)
+def _joined(spans: tuple[tuple[int, int], ...]) -> str:
+    """Decode and join the snippets at *spans* (memoised - prompts repeat)."""
+    blob = _BLOB
+    return b"\n".join([blob[off : off + size] for off, size in spans]).decode("utf-8")
+
+
 def get_syntax_text(objects: list[str]) -> str:
     """Return concatenated snippets for *objects*.
 
@@ -52,11 +88,22 @@ def get_syntax_text(objects: list[str]) -> str:
     if not objects:
         raise ValueError("Empty object list")
 
-    missing = [o for o in objects if o not in _SYNTAX_MAP]
+    # single lookup per name; bind the hot methods to locals
+    spans: list[tuple[int, int]] = []
+    missing: list[str] = []
+    get = _INDEX.get
+    add = spans.append
+    for o in objects:
+        span = get(o)
+        if span is None:
+            missing.append(o)
+        else:
+            add(span)
+
     if missing:
         raise KeyError(f"Objects not found in syntax map: {', '.join(missing)}")
 
-    return "\n".join(_SYNTAX_MAP[o] for o in objects)
+    return _joined(tuple(spans))
 
 
 # ---------------------------------------------------------------------------
@@ -65,25 +112,33 @@ def get_syntax_text(objects: list[str]) -> str:
 app = FastAPI(title="syntax_srv (syntax_map)")
 
 
-class SyntaxRequest(BaseModel):
+class SyntaxRequest(msgspec.Struct):  # pylint: disable=too-few-public-methods
     """Syntax request for FastAPI"""
 
     objects: list[str]
 
 
-class SyntaxReply(BaseModel):
+class SyntaxReply(msgspec.Struct):  # pylint: disable=too-few-public-methods
     """Syntax reply for FastAPI"""
 
     syntax: str
 
 
-@app.post("/get_syntax", response_model=SyntaxReply)
-def get_syntax(req: SyntaxRequest) -> SyntaxReply:
-    """Get syntax API wrapper"""
+_decode_request = msgspec.json.Decoder(SyntaxRequest).decode
+_encode_reply = msgspec.json.Encoder().encode
+
+
+@app.post("/get_syntax")
+async def get_syntax(request: Request) -> Response:
+    """Get syntax API wrapper (body validated and encoded by msgspec)"""
     try:
+        req = _decode_request(await request.body())
         snippet = get_syntax_text(req.objects)
-        return SyntaxReply(syntax=snippet)
-    except ValueError as exc:
+    except (msgspec.DecodeError, ValueError) as exc:
         raise HTTPException(422, str(exc)) from exc
     except KeyError as exc:
         raise HTTPException(404, str(exc)) from exc
+
+    return Response(
+        _encode_reply(SyntaxReply(syntax=snippet)), media_type="application/json"
+    )